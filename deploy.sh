@@ -48,6 +48,7 @@ mkdir -p "$deployment_dir"
 echo "📄 Copying files..."
 cp -r .github "$deployment_dir/"
 cp scraper.py "$deployment_dir/"
+cp -r scrapers "$deployment_dir/"
 cp requirements.txt "$deployment_dir/"
 cp README.md "$deployment_dir/"
 cp .gitignore "$deployment_dir/"
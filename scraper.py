@@ -12,61 +12,203 @@ Based on research from:
 """
 
 import os
+import re
 import json
 import time
+import hashlib
+import asyncio
 from pathlib import Path
-from datetime import datetime
-from playwright.sync_api import sync_playwright
-import requests
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from scrapers._browser import get_browser, close_browser
 
 # Groq API for AI parsing
 GROQ_API_KEY = os.environ.get('GROQ_API_KEY')
+GROQ_MODEL = "llama-3.3-70b-versatile"
+
+# Parsed Groq responses, keyed by prompt hash; least recently used files are evicted
+AI_CACHE_DIR = Path(".cache") / "ai"
+AI_CACHE_MAX_ENTRIES = 200
+
+# Domains whose plain HTML had no job links, so repeat runs go straight to Playwright
+JS_ONLY_CACHE_FILE = Path(".cache") / "js_only_domains.json"
+JS_ONLY_RECHECK_SECONDS = 7 * 24 * 3600  # Try plain HTTP again after a week
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Filter keywords, compiled once per process: one scan instead of one `in` per keyword
+TECH_KEYWORDS = ("software", "engineer", "developer", "data", "ml", "ai", "devops", "sre")
+US_KEYWORDS = ("us", "united states", "remote", "california", "texas", "new york", "washington")
+TECH_RE = re.compile("|".join(map(re.escape, TECH_KEYWORDS)), re.IGNORECASE)
+US_RE = re.compile("|".join(map(re.escape, US_KEYWORDS)), re.IGNORECASE)
 
 
 class CareerPageScraper:
     """Scrapes jobs from company career pages in GitHub Actions."""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 5):
         self.jobs = []
         self.output_dir = Path("jobs")
         self.output_dir.mkdir(exist_ok=True)
+        self.max_concurrency = max_concurrency
+        self._http = None
+        self._groq = None
+        self._js_only = self._load_js_only()  # domain -> when plain HTTP last failed to yield job links
+
+    async def start(self):
+        """Open the HTTP clients (Chromium is launched lazily by get_browser)."""
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            follow_redirects=True,
+            headers={'User-Agent': USER_AGENT}
+        )
+        if GROQ_API_KEY:
+            # One keep-alive connection to Groq for every company's prompt
+            self._groq = httpx.AsyncClient(
+                http2=True,
+                timeout=30,
+                headers={
+                    "Authorization": f"Bearer {GROQ_API_KEY}",
+                    "Content-Type": "application/json"
+                }
+            )
 
-    def scrape_with_playwright(self, url: str, company: str) -> list:
-        """Scrape page with Playwright."""
+    async def close(self):
+        """Shut down the HTTP clients; the shared browser is closed by the run owner."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        if self._groq:
+            await self._groq.aclose()
+            self._groq = None
+
+    @staticmethod
+    def _load_js_only() -> dict:
+        """Load the JS-only domain verdicts saved by earlier runs."""
+        try:
+            return json.loads(JS_ONLY_CACHE_FILE.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_js_only(self):
+        """Persist the JS-only domain verdicts for the next run."""
+        JS_ONLY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        JS_ONLY_CACHE_FILE.write_text(json.dumps(self._js_only))
+
+    def _needs_browser(self, domain: str) -> bool:
+        """True if plain HTTP recently failed for this domain."""
+        checked = self._js_only.get(domain)
+        return checked is not None and time.time() - checked < JS_ONLY_RECHECK_SECONDS
+
+    async def _fetch_static(self, url: str):
+        """Fetch server-rendered HTML without a browser (None if the fetch failed)."""
+        try:
+            response = await self._http.get(url)
+            if response.status_code == 200:
+                return response.text
+        except httpx.HTTPError:
+            pass
+        return None
+
+    async def _render_page(self, url: str) -> str:
+        """Render page with Playwright in a fresh context on the shared browser."""
+        browser = await get_browser()
+        context = await browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={"width": 1280, "height": 800}
+        )
+        try:
+            page = await context.new_page()
+
+            # Navigate to page
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            try:
+                # Wait for JS to load
+                await page.wait_for_load_state("networkidle", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass  # Pages with long-polling never go idle; use what has rendered
+
+            # Get page content
+            return await page.content()
+        finally:
+            await context.close()
+
+    async def scrape_with_playwright(self, url: str, company: str) -> list:
+        """Scrape page, skipping Playwright when plain HTTP already has the jobs."""
         print(f"\n🔍 Scraping {company}: {url}")
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                # Navigate to page
-                page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                time.sleep(3)  # Wait for JS to load
-
-                # Get page content
-                content = page.content()
-                browser.close()
-
-                # Parse with AI if available
-                if GROQ_API_KEY:
-                    jobs = self.parse_with_ai(content, company)
-                else:
-                    # Simple fallback parsing
-                    jobs = self.simple_parse(content, company)
-
-                print(f"   ✅ Found {len(jobs)} jobs")
-                return jobs
+            content = None
+            jobs = None
+
+            # Fast path: static HTML is good enough if it already lists jobs
+            domain = urlparse(url).netloc
+            if not self._needs_browser(domain):
+                html = await self._fetch_static(url)
+                # A failed fetch says nothing about the page, so only a real 200 gives a verdict
+                if html is not None:
+                    static_jobs = self.simple_parse(html, company)
+                    if len(static_jobs) >= 3:
+                        self._js_only.pop(domain, None)
+                        content, jobs = html, static_jobs
+                    else:
+                        self._js_only[domain] = time.time()
+
+            if content is None:
+                content = await self._render_page(url)
+
+            # Parse with AI if available
+            if GROQ_API_KEY:
+                jobs = await self.parse_with_ai(content, company)
+            elif jobs is None:
+                # Simple fallback parsing
+                jobs = self.simple_parse(content, company)
+
+            print(f"   ✅ Found {len(jobs)} jobs")
+            return jobs
 
         except Exception as e:
             print(f"   ❌ Error: {str(e)[:100]}")
             return []
 
-    def parse_with_ai(self, html_content: str, company: str) -> list:
+    @staticmethod
+    def _strip_non_content(html_content: str) -> str:
+        """Drop scripts, styles, SVGs and comments so the prompt budget goes to markup."""
+        tree = LexborHTMLParser(html_content)
+        tree.strip_tags(['script', 'style', 'svg', 'noscript'])
+        comments = [node for node in tree.root.traverse(include_text=False) if node.tag == '-comment']
+        for node in comments:
+            node.decompose()
+        return tree.html or ""
+
+    @staticmethod
+    def _clean_ai_jobs(jobs: list) -> list:
+        """Keep only postings with string title, location and url."""
+        return [
+            job for job in jobs
+            if isinstance(job, dict) and all(isinstance(job.get(key), str) for key in ("title", "location", "url"))
+        ]
+
+    @staticmethod
+    def _store_ai_result(cache_file: Path, jobs: list):
+        """Write a parsed Groq result and evict the least recently used entries."""
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(jobs))
+
+        entries = sorted(cache_file.parent.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-AI_CACHE_MAX_ENTRIES]:
+            stale.unlink(missing_ok=True)
+
+    async def parse_with_ai(self, html_content: str, company: str) -> list:
         """Parse HTML with Groq AI."""
         try:
-            # Truncate content to fit in context
-            content_preview = html_content[:15000]
+            # Truncate visible markup to fit in context
+            content_preview = self._strip_non_content(html_content)[:15000]
 
             prompt = f"""
 Extract job postings for {company} from this HTML.
@@ -78,18 +220,20 @@ HTML:
 {content_preview}
 """
 
-            response = requests.post(
+            # Unchanged page (scripts already stripped) -> same prompt -> reuse the last answer
+            cache_key = hashlib.sha256(f"{GROQ_MODEL}\n{prompt}".encode()).hexdigest()
+            cache_file = AI_CACHE_DIR / f"{cache_key}.json"
+            if cache_file.exists():
+                os.utime(cache_file)  # Mark as recently used
+                return self._clean_ai_jobs(json.loads(cache_file.read_text()))
+
+            response = await self._groq.post(
                 "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {GROQ_API_KEY}",
-                    "Content-Type": "application/json"
-                },
                 json={
-                    "model": "llama-3.3-70b-versatile",
+                    "model": GROQ_MODEL,
                     "messages": [{"role": "user", "content": prompt}],
                     "temperature": 0.1
-                },
-                timeout=30
+                }
             )
 
             if response.status_code == 200:
@@ -102,8 +246,13 @@ HTML:
                     if content.startswith("json"):
                         content = content[4:]
 
-                jobs = json.loads(content.strip())
-                return jobs if isinstance(jobs, list) else []
+                answer = json.loads(content.strip())
+                if not isinstance(answer, list):
+                    return []  # Not cached: a bad answer would hide this page until it changes
+                jobs = self._clean_ai_jobs(answer)
+                if jobs or not answer:
+                    self._store_ai_result(cache_file, jobs)
+                return jobs
 
         except Exception as e:
             print(f"      ⚠️ AI parsing failed: {str(e)[:50]}")
@@ -112,30 +261,28 @@ HTML:
 
     def simple_parse(self, html_content: str, company: str) -> list:
         """Simple fallback parser."""
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html_content, 'html.parser')
+        tree = LexborHTMLParser(html_content)
         jobs = []
+        base_url = f"https://{company.lower().replace(' ', '')}.com"
 
         # Look for common job link patterns
-        for link in soup.find_all('a', href=True):
-            text = link.get_text(strip=True)
-            href = link['href']
+        for link in tree.css('a[href]'):
+            text = link.text(strip=True)
+            href = link.attributes.get('href') or ''
 
             # Filter for tech roles
-            tech_keywords = ['engineer', 'developer', 'data', 'software', 'ml', 'ai']
-            if any(kw in text.lower() for kw in tech_keywords) and len(text) > 10:
+            if len(text) > 10 and TECH_RE.search(text):
                 jobs.append({
                     "company": company,
                     "title": text,
                     "location": "Unknown",
-                    "url": href if href.startswith('http') else f"https://{company.lower().replace(' ', '')}.com{href}"
+                    "url": href if href.startswith('http') else f"{base_url}{href}"
                 })
 
         return jobs[:50]  # Limit to 50
 
-    def scrape_all_companies(self):
-        """Scrape top tech companies."""
+    async def scrape_all_companies(self):
+        """Scrape top tech companies concurrently."""
         print("=" * 70)
         print("🚀 GITHUB ACTIONS CAREER PAGE SCRAPER")
         print("=" * 70)
@@ -154,61 +301,74 @@ HTML:
             {"name": "Databricks", "url": "https://www.databricks.com/company/careers/open-positions?department=Engineering"},
         ]
 
-        for company in companies:
-            jobs = self.scrape_with_playwright(company["url"], company["name"])
+        # Bounded concurrency doubles as rate limiting
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def scrape_company(company):
+            async with sem:
+                return await self.scrape_with_playwright(company["url"], company["name"])
+
+        await self.start()
+        try:
+            results = await asyncio.gather(
+                *(scrape_company(company) for company in companies),
+                return_exceptions=True
+            )
+        finally:
+            await self.close()
+        self._save_js_only()
+
+        # One timestamp for the whole batch keeps scraped_at consistent across jobs
+        run_ts = datetime.now(timezone.utc).isoformat()
+
+        for company, jobs in zip(companies, results):
+            if isinstance(jobs, Exception):
+                print(f"   ❌ {company['name']}: {str(jobs)[:100]}")
+                continue
 
             # Filter for US locations and tech roles
             for job in jobs:
                 if self.is_valid_job(job):
-                    job["scraped_at"] = datetime.now().isoformat()
+                    job["scraped_at"] = run_ts
                     job["source"] = "career_page"
                     self.jobs.append(job)
 
-            time.sleep(5)  # Rate limiting
-
         # Save results
         self.save_results()
 
     def is_valid_job(self, job: dict) -> bool:
         """Validate job is tech role + US location."""
-        title = job.get("title", "").lower()
-        location = job.get("location", "").lower()
+        title = job.get("title") or ""
+        location = job.get("location") or ""
 
         # Tech keywords
-        tech_kw = ["software", "engineer", "developer", "data", "ml", "ai", "devops", "sre"]
-        is_tech = any(kw in title for kw in tech_kw)
+        is_tech = TECH_RE.search(title) is not None
 
         # US location (or unknown)
-        us_kw = ["us", "united states", "remote", "california", "texas", "new york", "washington"]
-        is_us = any(kw in location for kw in us_kw) or location == "unknown"
+        is_us = US_RE.search(location) is not None or location.lower() == "unknown"
 
         return is_tech and is_us
 
     def save_results(self):
-        """Save jobs to JSON and individual folders."""
+        """Save jobs to the master JSON file."""
         print(f"\n💾 Saving {len(self.jobs)} jobs...")
 
         # Save master JSON
         with open(self.output_dir / "all_jobs.json", 'w') as f:
             json.dump(self.jobs, f, indent=2)
 
-        # Create individual job folders
-        for i, job in enumerate(self.jobs, 1):
-            job_dir = self.output_dir / f"job_{i:03d}"
-            job_dir.mkdir(exist_ok=True)
-
-            # Save job details
-            with open(job_dir / "details.json", 'w') as f:
-                json.dump(job, f, indent=2)
-
-            # Save apply URL
-            with open(job_dir / "apply_url.txt", 'w') as f:
-                f.write(job.get("url", ""))
-
         print(f"   ✅ Saved to {self.output_dir}/")
         print(f"\n✅ COMPLETE: {len(self.jobs)} jobs scraped from career pages!")
 
 
-if __name__ == "__main__":
+async def main():
+    """Main entry point."""
     scraper = CareerPageScraper()
-    scraper.scrape_all_companies()
+    try:
+        await scraper.scrape_all_companies()
+    finally:
+        await close_browser()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,11 +10,14 @@ Orchestrates multiple scraping strategies:
 Runs in GitHub Actions hourly.
 """
 
-import json
 import sys
+import logging
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 # Add scrapers directory to path
 sys.path.insert(0, str(Path(__file__).parent / "scrapers"))
 
@@ -70,29 +73,27 @@ class ProductionScraper:
         print("📊 FINAL SUMMARY")
         print("=" * 70)
 
-        # Count by portal type
-        greenhouse_count = len([j for j in self.all_jobs if j.get("portal") == "greenhouse"])
-        lever_count = len([j for j in self.all_jobs if j.get("portal") == "lever"])
+        # Count by portal and company in one pass
+        portal_counts = Counter()
+        company_counts = Counter()
+        for job in self.all_jobs:
+            portal_counts[job.get("portal")] += 1
+            company_counts[job.get("company", "Unknown")] += 1
 
-        print(f"Greenhouse jobs:         {greenhouse_count}")
-        print(f"Lever jobs:              {lever_count}")
+        print(f"Greenhouse jobs:         {portal_counts['greenhouse']}")
+        print(f"Lever jobs:              {portal_counts['lever']}")
         print(f"TOTAL JOBS:              {len(self.all_jobs)}")
         print()
 
-        # Count by company (top 10)
-        company_counts = {}
-        for job in self.all_jobs:
-            company = job.get("company", "Unknown")
-            company_counts[company] = company_counts.get(company, 0) + 1
-
+        # Top 10 companies
         print("Top 10 Companies by Job Count:")
-        for i, (company, count) in enumerate(sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:10], 1):
+        for i, (company, count) in enumerate(company_counts.most_common(10), 1):
             print(f"  {i:2d}. {company:30s} {count:3d} jobs")
 
         print("=" * 70)
 
     def save_results(self):
-        """Save all jobs to structured folders."""
+        """Save all jobs to the master JSON and a summary CSV."""
         if not self.all_jobs:
             print("\n⚠️  No jobs to save!")
             return
@@ -101,47 +102,9 @@ class ProductionScraper:
 
         # Save master JSON
         master_json = self.output_dir / "all_jobs.json"
-        with open(master_json, 'w') as f:
-            json.dump(self.all_jobs, f, indent=2)
+        master_json.write_bytes(orjson.dumps(self.all_jobs, option=orjson.OPT_INDENT_2))
         print(f"   ✅ Master JSON: {master_json}")
 
-        # Create individual job folders
-        for i, job in enumerate(self.all_jobs, 1):
-            job_dir = self.output_dir / f"job_{i:04d}"
-            job_dir.mkdir(exist_ok=True)
-
-            # Save metadata
-            meta = {
-                "company": job.get("company"),
-                "title": job.get("title"),
-                "location": job.get("location"),
-                "url": job.get("url"),
-                "portal": job.get("portal"),
-                "job_id": job.get("job_id"),
-                "scraped_at": datetime.now().isoformat()
-            }
-
-            with open(job_dir / "meta.json", 'w') as f:
-                json.dump(meta, f, indent=2)
-
-            # Save apply URL
-            with open(job_dir / "apply_url.txt", 'w') as f:
-                f.write(job.get("url", ""))
-
-            # Save job description
-            with open(job_dir / "JD.txt", 'w') as f:
-                f.write(f"Job: {job.get('title')}\n")
-                f.write(f"Company: {job.get('company')}\n")
-                f.write(f"Location: {job.get('location')}\n")
-                f.write(f"Portal: {job.get('portal')}\n")
-                f.write(f"\nApply: {job.get('url')}\n\n")
-                f.write(f"Description:\n{job.get('description', '[Visit URL for full description]')}\n")
-
-            if i % 25 == 0:
-                print(f"   Created {i} folders...")
-
-        print(f"   ✅ Created {len(self.all_jobs)} job folders")
-
         # Create summary CSV for easy viewing
         import csv
         csv_path = self.output_dir / "jobs_summary.csv"
@@ -165,6 +128,7 @@ class ProductionScraper:
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     scraper = ProductionScraper()
     scraper.scrape_all()
 
@@ -9,27 +9,34 @@ Optimized file structure to prevent repo bloat:
 
 Output Structure:
 jobs/
-  ├── all_jobs.json              # All unique jobs (deduplicated)
+  ├── all_jobs.jsonl             # All unique jobs (deduplicated, one per line)
   ├── jobs_summary.csv           # Quick overview
   ├── daily/
   │   ├── 2026-02-02.json       # All jobs scraped on this day
   │   └── 2026-02-03.json
   └── by_company/
-      ├── anthropic.json         # All Anthropic jobs
-      └── openai.json
+      ├── anthropic.jsonl        # All Anthropic jobs (append-only)
+      └── openai.jsonl
 
 Runs in GitHub Actions hourly.
 """
 
-import json
 import sys
+import asyncio
+import logging
 from pathlib import Path
 from datetime import datetime, timezone
 import csv
+from collections import Counter
+from operator import itemgetter
+
+import orjson
 
 # Add scrapers directory to path
 sys.path.insert(0, str(Path(__file__).parent / "scrapers"))
 
+from _base import make_process_pool
+from _http import RateLimitedFetcher, make_session
 from greenhouse_scraper import GreenhouseScraper
 from lever_scraper import LeverScraper
 from workday_scraper import WorkdayScraper
@@ -47,175 +54,218 @@ class ProductionScraperV3:
         (self.output_dir / "by_company").mkdir(exist_ok=True)
 
         self.all_jobs = []
-        self.existing_jobs = self._load_existing_jobs()
-
-    def _load_existing_jobs(self):
-        """Load existing jobs for deduplication."""
-        master_file = self.output_dir / "all_jobs.json"
-        if master_file.exists():
+        self._migrate_legacy_json()
+
+        # Dedup index over existing jobs, built once per run
+        self._existing_by_hash = self._load_existing_jobs()
+
+    @staticmethod
+    def _append_jsonl(path, jobs):
+        """Append jobs to a JSON Lines file, one compact object per line."""
+        with open(path, 'ab') as f:
+            f.writelines(orjson.dumps(job) + b"\n" for job in jobs)
+
+    def _migrate_legacy_json(self):
+        """Convert all_jobs.json and by_company/*.json from older runs to JSONL, once."""
+        legacy_files = [self.output_dir / "all_jobs.json", *(self.output_dir / "by_company").glob("*.json")]
+        for legacy_file in legacy_files:
+            jsonl_file = legacy_file.with_suffix(".jsonl")
+            if not legacy_file.exists() or jsonl_file.exists():
+                continue
             try:
-                with open(master_file, 'r') as f:
-                    jobs = json.load(f)
-                    print(f"📂 Loaded {len(jobs)} existing jobs for deduplication")
-                    return jobs
-            except:
-                return []
-        return []
-
-    def _generate_job_hash(self, job):
-        """Generate unique hash for job deduplication."""
-        # Use company + job_id as unique identifier
-        return f"{job.get('company', '')}_{job.get('job_id', '')}".lower().replace(" ", "_")
-
-    def _deduplicate_jobs(self, new_jobs):
-        """Remove duplicate jobs based on company + job_id."""
-        existing_hashes = {self._generate_job_hash(job) for job in self.existing_jobs}
-
-        unique_new_jobs = []
-        duplicates = 0
-
-        for job in new_jobs:
-            job_hash = self._generate_job_hash(job)
-            if job_hash not in existing_hashes:
-                unique_new_jobs.append(job)
-                existing_hashes.add(job_hash)
-            else:
-                duplicates += 1
+                jobs = orjson.loads(legacy_file.read_bytes())
+            except orjson.JSONDecodeError:
+                continue
+            self._append_jsonl(jsonl_file, jobs)
+            legacy_file.unlink()
+
+    def _iter_master_jobs(self):
+        """Stream jobs from all_jobs.jsonl one at a time."""
+        master_file = self.output_dir / "all_jobs.jsonl"
+        if not master_file.exists():
+            return
 
-        if duplicates > 0:
-            print(f"   🔄 Skipped {duplicates} duplicate jobs")
+        with open(master_file, 'rb') as f:
+            for line in f:
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue  # Blank or partially written line
 
-        return unique_new_jobs
+    def _load_existing_jobs(self):
+        """Index existing jobs by dedup hash, keeping only the fields freshness tracking reads."""
+        existing_by_hash = {}
+        for job in self._iter_master_jobs():
+            existing_by_hash[self._generate_job_hash(job)] = {
+                'first_discovered': job.get('first_discovered'),
+                'first_discovered_ts': job.get('first_discovered_ts'),
+                'times_seen': job.get('times_seen', 1)
+            }
+        print(f"📂 Loaded {len(existing_by_hash)} existing jobs for deduplication")
+        return existing_by_hash
 
-    def _enrich_with_freshness(self, new_jobs):
-        """Add freshness tracking: first_discovered, hours_old, apply_priority."""
-        enriched_jobs = []
+    def _generate_job_hash(self, job):
+        """Generate unique hash for job deduplication (cached on the job as _dedup_key)."""
+        job_hash = job.get('_dedup_key')
+        if job_hash is None:
+            # Use company + job_id as unique identifier
+            job_hash = f"{job.get('company', '')}_{job.get('job_id', '')}".lower().replace(" ", "_")
+            job['_dedup_key'] = job_hash
+        return job_hash
+
+    @staticmethod
+    def _parse_timestamp(timestamp_str):
+        """Parse a first_discovered string from older runs into epoch seconds."""
+        # Robust timestamp parsing with multiple fallbacks
+        try:
+            # Normalize timestamp: remove 'Z' or fix duplicate timezone suffixes
+            if timestamp_str.endswith('Z'):
+                timestamp_str = timestamp_str[:-1] + '+00:00'
+            elif '+00:00+00:00' in timestamp_str:
+                # Fix malformed timestamps from previous bug
+                timestamp_str = timestamp_str.replace('+00:00+00:00', '+00:00')
+            first_discovered = datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            # Aggressive cleanup for any malformed timestamps
+            # Remove all timezone info and add clean UTC
+            timestamp_str = timestamp_str.split('+')[0].split('Z')[0] + '+00:00'
+            first_discovered = datetime.fromisoformat(timestamp_str)
+        return first_discovered.timestamp()
+
+    @staticmethod
+    def _score_age(hours_old, days_old):
+        """Map job age to (apply_priority, freshness_score) in one bucket lookup."""
+        if hours_old <= 24:
+            return 'HIGH', 100
+        if hours_old <= 48:
+            return 'MEDIUM', 75
+        if hours_old <= 168:  # 7 days
+            return 'LOW', 50 - (hours_old - 48) / 120 * 30  # Decay from 50 to 20 over 5 days
+        return 'EXPIRED', max(0, 20 - (days_old - 7) * 2)  # Decay after 7 days
+
+    def _enrich_with_freshness(self, job, now_ts, now_iso):
+        """Add freshness tracking to a job: first_discovered, hours_old, apply_priority."""
+        job_hash = self._generate_job_hash(job)
+
+        # Check if we've seen this job before
+        existing = self._existing_by_hash.get(job_hash)
+        if existing is not None:
+            # Preserve original discovery time
+            first_ts = existing.get('first_discovered_ts')
+            if first_ts is None and existing.get('first_discovered'):
+                first_ts = self._parse_timestamp(existing['first_discovered'])
+            job['first_discovered'] = existing['first_discovered'] or now_iso
+            job['first_discovered_ts'] = first_ts if first_ts is not None else now_ts
+            job['times_seen'] = existing.get('times_seen', 1) + 1
+        else:
+            # Brand new job - mark when we first discovered it
+            job['first_discovered'] = now_iso
+            job['first_discovered_ts'] = now_ts
+            job['times_seen'] = 1
+
+        # Calculate age
+        hours_old = (now_ts - job['first_discovered_ts']) / 3600
+        days_old = int(hours_old // 24)
+
+        job['hours_old'] = round(hours_old, 1)
+        job['days_old'] = days_old
+
+        # Apply priority and freshness score (0-100) share the same age buckets
+        job['apply_priority'], freshness = self._score_age(hours_old, days_old)
+        job['freshness_score'] = round(freshness, 1)
+
+    async def _write_new_jobs(self, queue):
+        """
+        Single writer: dedup, enrich and append each scraped job to all_jobs.jsonl
+        as it arrives, so duplicates are dropped instead of piling up until the end.
+
+        Returns:
+            Number of jobs scraped (new unique ones are collected in self.all_jobs)
+        """
+        # One clock read per run; ages are plain epoch arithmetic from here
         now = datetime.now(timezone.utc)
-
-        # Build lookup of existing jobs
-        existing_lookup = {}
-        for job in self.existing_jobs:
-            job_hash = self._generate_job_hash(job)
-            existing_lookup[job_hash] = job
-
-        for job in new_jobs:
-            job_hash = self._generate_job_hash(job)
-
-            # Check if we've seen this job before
-            if job_hash in existing_lookup:
-                existing = existing_lookup[job_hash]
-                # Preserve original discovery time
-                job['first_discovered'] = existing.get('first_discovered', now.isoformat() + "Z")
-                job['times_seen'] = existing.get('times_seen', 1) + 1
-            else:
-                # Brand new job - mark when we first discovered it
-                job['first_discovered'] = now.isoformat() + "Z"
-                job['times_seen'] = 1
-
-            # Calculate age - handle multiple timestamp formats
-            timestamp_str = job['first_discovered']
-            # Robust timestamp parsing with multiple fallbacks
+        now_ts = now.timestamp()
+        now_iso = now.isoformat().replace('+00:00', 'Z')
+
+        seen_hashes = set()
+        scraped = 0
+
+        # Appends are a few hundred bytes each; a plain file is fine on the loop thread
+        with open(self.output_dir / "all_jobs.jsonl", 'ab') as f:
+            while (job := await queue.get()) is not None:
+                scraped += 1
+                # The scrapers' ETag caches hold this dict too; annotate a copy
+                job = dict(job)
+                job_hash = self._generate_job_hash(job)
+                if job_hash in self._existing_by_hash or job_hash in seen_hashes:
+                    continue
+                seen_hashes.add(job_hash)
+
+                self._enrich_with_freshness(job, now_ts, now_iso)
+                f.write(orjson.dumps(job) + b"\n")
+                self.all_jobs.append(job)
+
+        return scraped
+
+    async def _scrape_portals(self, pool):
+        """Run the three API scrapers at once, feeding their jobs to the writer as they arrive."""
+        queue = asyncio.Queue(maxsize=1000)
+        # Global and per-host request limits apply across all three portals
+        fetcher = RateLimitedFetcher()
+
+        async def produce():
+            # Scrapers share DNS cache, TLS context and connections
             try:
-                # Normalize timestamp: remove 'Z' or fix duplicate timezone suffixes
-                if timestamp_str.endswith('Z'):
-                    timestamp_str = timestamp_str[:-1] + '+00:00'
-                elif '+00:00+00:00' in timestamp_str:
-                    # Fix malformed timestamps from previous bug
-                    timestamp_str = timestamp_str.replace('+00:00+00:00', '+00:00')
-                first_discovered = datetime.fromisoformat(timestamp_str)
-            except ValueError:
-                # Aggressive cleanup for any malformed timestamps
-                # Remove all timezone info and add clean UTC
-                timestamp_str = timestamp_str.split('+')[0].split('Z')[0] + '+00:00'
-                first_discovered = datetime.fromisoformat(timestamp_str)
-            age_delta = now - first_discovered
-            hours_old = age_delta.total_seconds() / 3600
-            days_old = age_delta.days
-
-            job['hours_old'] = round(hours_old, 1)
-            job['days_old'] = days_old
-
-            # Calculate apply priority based on age
-            if hours_old <= 24:
-                job['apply_priority'] = 'HIGH'
-            elif hours_old <= 48:
-                job['apply_priority'] = 'MEDIUM'
-            elif hours_old <= 168:  # 7 days
-                job['apply_priority'] = 'LOW'
-            else:
-                job['apply_priority'] = 'EXPIRED'
-
-            # Freshness score (0-100)
-            if hours_old <= 24:
-                freshness = 100
-            elif hours_old <= 48:
-                freshness = 75
-            elif hours_old <= 168:
-                freshness = 50 - (hours_old - 48) / 120 * 30  # Decay from 50 to 20 over 5 days
-            else:
-                freshness = max(0, 20 - (days_old - 7) * 2)  # Decay after 7 days
-
-            job['freshness_score'] = round(freshness, 1)
-
-            enriched_jobs.append(job)
-
-        return enriched_jobs
+                async with make_session() as session:
+                    await asyncio.gather(
+                        GreenhouseScraper(session=session, queue=queue, pool=pool, fetcher=fetcher).scrape_all(),
+                        LeverScraper(session=session, queue=queue, pool=pool, fetcher=fetcher).scrape_all(),
+                        WorkdayScraper(session=session, queue=queue, fetcher=fetcher).scrape_all()
+                    )
+            finally:
+                await queue.put(None)  # No more jobs
+
+        # Awaited together so a failing writer stops the run instead of leaving producers blocked
+        scraped, _ = await asyncio.gather(self._write_new_jobs(queue), produce())
+        return scraped
 
     def scrape_all(self):
-        """Run all scrapers in priority order."""
+        """Run all scrapers and save the new jobs."""
         print("=" * 70)
         print("🚀 PRODUCTION CAREER PAGE SCRAPER V3")
         print("=" * 70)
         print(f"⏰ Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print()
 
-        # Phase 1: Greenhouse API (fastest, most reliable)
+        # Greenhouse, Lever and Workday APIs run concurrently over one session
         print("\n" + "=" * 70)
-        print("PHASE 1: GREENHOUSE API SCRAPING")
+        print("SCRAPING GREENHOUSE, LEVER & WORKDAY APIS (Amazon, Microsoft, Goldman Sachs, etc.)")
         print("=" * 70)
-        greenhouse = GreenhouseScraper()
-        greenhouse_jobs = greenhouse.scrape_all_companies()
+        # Jobs are deduplicated, enriched and appended to all_jobs.jsonl while scraping
+        # One worker pool for the whole run, shut down once the event loop is done
+        with make_process_pool() as pool:
+            total_scraped = asyncio.run(self._scrape_portals(pool))
 
-        # Phase 2: Lever API
-        print("\n" + "=" * 70)
-        print("PHASE 2: LEVER API SCRAPING")
-        print("=" * 70)
-        lever = LeverScraper()
-        lever_jobs = lever.scrape_all_companies()
-
-        # Phase 3: Workday API
-        print("\n" + "=" * 70)
-        print("PHASE 3: WORKDAY API SCRAPING (Amazon, Microsoft, Goldman Sachs, etc.)")
-        print("=" * 70)
-        workday = WorkdayScraper()
-        workday_jobs = workday.scrape_all_companies()
-
-        # Combine all scraped jobs
-        all_scraped = greenhouse_jobs + lever_jobs + workday_jobs
-
-        # Deduplicate
         print("\n" + "=" * 70)
         print("🔄 DEDUPLICATION & FRESHNESS TRACKING")
         print("=" * 70)
-        print(f"   Total scraped: {len(all_scraped)}")
-        unique_jobs = self._deduplicate_jobs(all_scraped)
-        print(f"   New unique jobs: {len(unique_jobs)}")
-
-        # Add freshness tracking
-        enriched_jobs = self._enrich_with_freshness(unique_jobs)
+        print(f"   Total scraped: {total_scraped}")
+        duplicates = total_scraped - len(self.all_jobs)
+        if duplicates > 0:
+            print(f"   🔄 Skipped {duplicates} duplicate jobs")
+        print(f"   New unique jobs: {len(self.all_jobs)}")
 
         # Show freshness breakdown
-        high_priority = len([j for j in enriched_jobs if j['apply_priority'] == 'HIGH'])
-        medium_priority = len([j for j in enriched_jobs if j['apply_priority'] == 'MEDIUM'])
-        low_priority = len([j for j in enriched_jobs if j['apply_priority'] == 'LOW'])
+        priority_counts = Counter(j['apply_priority'] for j in self.all_jobs)
+        high_priority = priority_counts['HIGH']
+        medium_priority = priority_counts['MEDIUM']
+        low_priority = priority_counts['LOW']
 
         print(f"\n   📊 Freshness Breakdown:")
         print(f"   HIGH priority (<24h):     {high_priority} jobs 🔥")
         print(f"   MEDIUM priority (24-48h): {medium_priority} jobs")
         print(f"   LOW priority (2-7 days):  {low_priority} jobs")
 
-        self.all_jobs = enriched_jobs
-
         # Print final summary
         self.print_summary()
 
@@ -228,33 +278,31 @@ class ProductionScraperV3:
         print("📊 SCRAPING SUMMARY")
         print("=" * 70)
 
-        # Count by portal type
-        greenhouse_count = len([j for j in self.all_jobs if j.get("portal") == "greenhouse"])
-        lever_count = len([j for j in self.all_jobs if j.get("portal") == "lever"])
-        workday_count = len([j for j in self.all_jobs if j.get("portal") == "workday"])
+        # Count by portal, priority and company in one pass
+        portal_counts = Counter()
+        priority_counts = Counter()
+        company_counts = Counter()
+        for job in self.all_jobs:
+            portal_counts[job.get("portal")] += 1
+            priority_counts[job.get("apply_priority")] += 1
+            company_counts[job.get("company", "Unknown")] += 1
 
-        print(f"Greenhouse jobs:         {greenhouse_count}")
-        print(f"Lever jobs:              {lever_count}")
-        print(f"Workday jobs:            {workday_count}")
+        print(f"Greenhouse jobs:         {portal_counts['greenhouse']}")
+        print(f"Lever jobs:              {portal_counts['lever']}")
+        print(f"Workday jobs:            {portal_counts['workday']}")
         print(f"NEW UNIQUE JOBS:         {len(self.all_jobs)}")
-        print(f"Total in database:       {len(self.existing_jobs) + len(self.all_jobs)}")
+        print(f"Total in database:       {len(self._existing_by_hash) + len(self.all_jobs)}")
 
         # Freshness breakdown for new jobs
         if self.all_jobs:
-            high_pri = len([j for j in self.all_jobs if j.get('apply_priority') == 'HIGH'])
-            print(f"\n🔥 Apply immediately:    {high_pri} HIGH priority jobs (<24h old)")
+            print(f"\n🔥 Apply immediately:    {priority_counts['HIGH']} HIGH priority jobs (<24h old)")
 
         print()
 
-        # Count by company (top 10)
+        # Top 10 companies
         if self.all_jobs:
-            company_counts = {}
-            for job in self.all_jobs:
-                company = job.get("company", "Unknown")
-                company_counts[company] = company_counts.get(company, 0) + 1
-
             print("Top Companies (New Jobs):")
-            for i, (company, count) in enumerate(sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:10], 1):
+            for i, (company, count) in enumerate(company_counts.most_common(10), 1):
                 print(f"  {i:2d}. {company:30s} {count:3d} jobs")
 
         print("=" * 70)
@@ -268,17 +316,14 @@ class ProductionScraperV3:
         print(f"\n💾 Saving {len(self.all_jobs)} new jobs...")
         today = datetime.now().strftime("%Y-%m-%d")
 
-        # 1. Update master all_jobs.json (append new jobs)
-        all_jobs_combined = self.existing_jobs + self.all_jobs
-        master_json = self.output_dir / "all_jobs.json"
-        with open(master_json, 'w') as f:
-            json.dump(all_jobs_combined, f, indent=2)
-        print(f"   ✅ Master JSON: {master_json} ({len(all_jobs_combined)} total jobs)")
+        # 1. New jobs were appended to master all_jobs.jsonl by the writer as they arrived
+        total_jobs = len(self._existing_by_hash) + len(self.all_jobs)
+        master_jsonl = self.output_dir / "all_jobs.jsonl"
+        print(f"   ✅ Master JSONL: {master_jsonl} ({total_jobs} total jobs)")
 
         # 2. Save today's scrape as daily snapshot
         daily_file = self.output_dir / "daily" / f"{today}.json"
-        with open(daily_file, 'w') as f:
-            json.dump(self.all_jobs, f, indent=2)
+        daily_file.write_bytes(orjson.dumps(self.all_jobs, option=orjson.OPT_INDENT_2))
         print(f"   ✅ Daily snapshot: {daily_file}")
 
         # 3. Save by company
@@ -290,56 +335,51 @@ class ProductionScraperV3:
             jobs_by_company[company].append(job)
 
         for company, jobs in jobs_by_company.items():
-            company_file = self.output_dir / "by_company" / f"{company}.json"
-
-            # Load existing company jobs if file exists
-            existing_company_jobs = []
-            if company_file.exists():
-                try:
-                    with open(company_file, 'r') as f:
-                        existing_company_jobs = json.load(f)
-                except:
-                    pass
-
-            # Append new jobs
-            all_company_jobs = existing_company_jobs + jobs
-
-            with open(company_file, 'w') as f:
-                json.dump(all_company_jobs, f, indent=2)
+            company_file = self.output_dir / "by_company" / f"{company}.jsonl"
+            self._append_jsonl(company_file, jobs)
 
         print(f"   ✅ Updated {len(jobs_by_company)} company files")
 
         # 4. Update summary CSV with freshness data
+        # Stream the master file so only the CSV columns of each job stay in memory
+        csv_rows = []
+        priority_counts = Counter()
+        for job in self._iter_master_jobs():
+            priority_counts[job.get('apply_priority')] += 1
+            csv_rows.append((
+                job.get('freshness_score', 0),
+                (
+                    job.get('apply_priority', 'UNKNOWN'),
+                    job.get('hours_old', ''),
+                    job.get('freshness_score', ''),
+                    job.get('company'),
+                    job.get('title'),
+                    job.get('location'),
+                    job.get('portal'),
+                    (job.get('first_discovered') or '')[:10],
+                    job.get('url')
+                )
+            ))
+        # Sort by freshness_score descending (freshest first)
+        csv_rows.sort(key=itemgetter(0), reverse=True)
+
         csv_path = self.output_dir / "jobs_summary.csv"
         with open(csv_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=[
+            writer = csv.writer(f)
+            writer.writerow([
                 'apply_priority', 'hours_old', 'freshness_score', 'company', 'title',
                 'location', 'portal', 'first_discovered', 'url'
             ])
-            writer.writeheader()
-            # Sort by freshness_score descending (freshest first)
-            sorted_jobs = sorted(all_jobs_combined, key=lambda x: x.get('freshness_score', 0), reverse=True)
-            for job in sorted_jobs:
-                writer.writerow({
-                    'apply_priority': job.get('apply_priority', 'UNKNOWN'),
-                    'hours_old': job.get('hours_old', ''),
-                    'freshness_score': job.get('freshness_score', ''),
-                    'company': job.get('company'),
-                    'title': job.get('title'),
-                    'location': job.get('location'),
-                    'portal': job.get('portal'),
-                    'first_discovered': job.get('first_discovered', '')[:10] if job.get('first_discovered') else '',
-                    'url': job.get('url')
-                })
-        print(f"   ✅ CSV summary: {csv_path} ({len(all_jobs_combined)} rows, sorted by freshness)")
+            writer.writerows(row for _, row in csv_rows)
+        print(f"   ✅ CSV summary: {csv_path} ({len(csv_rows)} rows, sorted by freshness)")
 
         # 5. Create README in jobs folder with freshness stats
         readme_path = self.output_dir / "README.md"
 
-        # Calculate freshness stats
-        high_pri = len([j for j in all_jobs_combined if j.get('apply_priority') == 'HIGH'])
-        med_pri = len([j for j in all_jobs_combined if j.get('apply_priority') == 'MEDIUM'])
-        low_pri = len([j for j in all_jobs_combined if j.get('apply_priority') == 'LOW'])
+        # Freshness stats (counted while building the CSV)
+        high_pri = priority_counts['HIGH']
+        med_pri = priority_counts['MEDIUM']
+        low_pri = priority_counts['LOW']
 
         with open(readme_path, 'w') as f:
             f.write(f"""# Job Scraping Results
@@ -348,7 +388,7 @@ class ProductionScraperV3:
 
 ## 📊 Stats
 
-- **Total Unique Jobs:** {len(all_jobs_combined)}
+- **Total Unique Jobs:** {total_jobs}
 - **New Jobs This Run:** {len(self.all_jobs)}
 - **Companies Tracked:** {len(jobs_by_company)}
 
@@ -363,9 +403,9 @@ class ProductionScraperV3:
 ## 📁 File Structure
 
 - `jobs_summary.csv` - **START HERE** (sorted by freshness, Excel-friendly)
-- `all_jobs.json` - All unique jobs (deduplicated, with full JD)
+- `all_jobs.jsonl` - All unique jobs (deduplicated, with full JD, one JSON object per line)
 - `daily/YYYY-MM-DD.json` - Jobs scraped each day
-- `by_company/company.json` - Jobs grouped by company
+- `by_company/company.jsonl` - Jobs grouped by company (one JSON object per line)
 
 ## 🎯 How to Use
 
@@ -384,8 +424,8 @@ class ProductionScraperV3:
 ## 🔍 Detailed Job Data
 
 For full job descriptions and metadata:
-1. `all_jobs.json` - Complete data with JD, departments, etc.
-2. `by_company/company.json` - All jobs from specific company
+1. `all_jobs.jsonl` - Complete data with JD, departments, etc.
+2. `by_company/company.jsonl` - All jobs from specific company
 3. `daily/` - Historical snapshots
 
 ## ⚡ Pro Tip
@@ -397,12 +437,13 @@ Focus on jobs with `hours_old < 24` for best application success rate!
 
         print(f"\n✅ SCRAPING COMPLETE!")
         print(f"📁 Output directory: {self.output_dir.absolute()}")
-        print(f"🎯 Total jobs in database: {len(all_jobs_combined)}")
+        print(f"🎯 Total jobs in database: {total_jobs}")
         print(f"🆕 New jobs this run: {len(self.all_jobs)}")
 
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     scraper = ProductionScraperV3()
     scraper.scrape_all()
 
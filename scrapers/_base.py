@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+ASYNC JSON BOARD SCRAPER BASE
+=============================
+Everything the ATS scrapers have in common: request headers, the
+rate-limited fetcher, the tech/US filters and the concurrent scrape_all
+loop. Subclasses set the portal name, list their companies, scrape one
+company and say how to turn one posting into a Job.
+
+SingleGetBoardScraper adds what boards fetched with one GET per company
+(Greenhouse, Lever) share: the ETag cache and the process pool for
+decoding big boards. Those only implement board_url / iter_jobs /
+parse_job; anything else (Workday's paginated search) subclasses
+AsyncJSONBoardScraper directly.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+import orjson
+
+from _http import RateLimitedFetcher, ETagCache, make_session
+from _filters import TECH_RE, US_RE, INTL_RE
+from _job import Job
+
+log = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+
+def make_process_pool() -> ProcessPoolExecutor:
+    """
+    Worker pool for decoding and filtering big boards.
+
+    Workers come from a forkserver (spawn where that is unavailable), never
+    fork: aiohttp's resolver threads are already running when the first
+    board is submitted. Create it outside the event loop and shut it down
+    there too, since shutdown blocks until the workers exit.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+
+
+class AsyncJSONBoardScraper(ABC):
+    """Base class for scrapers of public ATS JSON APIs."""
+
+    portal = ""  # Short name, e.g. "greenhouse" (also names the ETag cache file)
+    label = ""   # Display name, e.g. "Greenhouse"
+    extra_headers: Dict[str, str] = {}
+
+    # Filters; subclasses may swap in their own keyword regexes
+    tech_re = TECH_RE
+    us_re = US_RE
+    intl_re = INTL_RE
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        queue: Optional[asyncio.Queue] = None,
+        fetcher: Optional[RateLimitedFetcher] = None
+    ):
+        self.session = session  # Shared by the run owner; otherwise scrape_all opens its own
+        self.queue = queue  # If set, jobs are put here as each company finishes instead of returned
+        self.headers = {
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate, br',
+            **self.extra_headers
+        }
+        # Pass one fetcher to scrapers that run together so the limits hold for all of them
+        self.fetcher = fetcher or RateLimitedFetcher()
+
+    # ----- Subclass hooks -----
+
+    @abstractmethod
+    def get_companies(self) -> List:
+        """Companies to scrape, in whatever shape scrape_company expects."""
+
+    @abstractmethod
+    async def scrape_company(self, session: aiohttp.ClientSession, company) -> List[Dict]:
+        """Scrape one entry of get_companies() into US software/data job dicts."""
+
+    @staticmethod
+    @abstractmethod
+    def parse_job(job: Dict, company_name: str, **context) -> Optional[Job]:
+        """Parse one raw posting into a Job (None if it can't be parsed)."""
+
+    # ----- Filters -----
+
+    @classmethod
+    def is_tech_role(cls, job: Job) -> bool:
+        """Check if job is software/data related."""
+        return cls.tech_re.search(job._tech_text_lc) is not None
+
+    @classmethod
+    def is_us_location(cls, job: Job) -> bool:
+        """Check if location is in US."""
+        return cls._is_us_location_text(job._location_lc)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _is_us_location_text(cls, location: str) -> bool:
+        """US check on a lowercased location, memoized: boards repeat the same few hundred strings."""
+        if not location or location == "unknown":
+            return True  # Assume US if not specified
+
+        # Check for US indicators
+        if cls.us_re.search(location):
+            return True
+
+        # Exclude international locations
+        if cls.intl_re.search(location):
+            return False
+
+        # Default to True for ambiguous cases
+        return True
+
+    @classmethod
+    def filter_jobs(cls, raw_jobs: Iterable[Dict], company_name: str, **context) -> List[Dict]:
+        """Parse raw postings and keep US software/data jobs as dicts."""
+        parsed_jobs = []
+        for job in raw_jobs:
+            parsed = cls.parse_job(job, company_name, **context)
+            if parsed and cls.is_tech_role(parsed) and cls.is_us_location(parsed):
+                parsed_jobs.append(parsed.to_dict())
+        return parsed_jobs
+
+    # ----- Orchestration -----
+
+    def scrape_all_companies(self) -> List[Dict]:
+        """Scrape all companies (blocking wrapper around scrape_all)."""
+        return asyncio.run(self.scrape_all())
+
+    async def _scrape_and_publish(self, session: aiohttp.ClientSession, company) -> Tuple[int, List[Dict]]:
+        """Scrape one company; with a queue, hand its jobs to the consumer instead of keeping them."""
+        jobs = await self.scrape_company(session, company)
+        if self.queue is None:
+            return len(jobs), jobs
+        for job in jobs:
+            await self.queue.put(job)  # Waits while the consumer is behind
+        return len(jobs), []
+
+    async def _scrape_companies(self, session: aiohttp.ClientSession, companies: List) -> List:
+        """Run every company at once; failures come back as exceptions."""
+        return await asyncio.gather(
+            *(self._scrape_and_publish(session, company) for company in companies),
+            return_exceptions=True
+        )
+
+    async def scrape_all(self) -> List[Dict]:
+        """Scrape all companies concurrently (returns nothing when jobs go to self.queue)."""
+        print("=" * 70)
+        print(f"🏢 {self.label.upper()} API SCRAPER")
+        print("=" * 70)
+
+        companies = self.get_companies()
+
+        if self.session is not None:
+            results = await self._scrape_companies(self.session, companies)
+        else:
+            async with make_session() as session:
+                results = await self._scrape_companies(session, companies)
+
+        all_jobs = []
+        successful = 0
+        found = 0
+
+        for result in results:
+            if isinstance(result, Exception) or not result[0]:
+                continue
+            count, jobs = result
+            all_jobs.extend(jobs)
+            successful += 1
+            found += count
+
+        print("\n" + "=" * 70)
+        print(f"📊 {self.label.upper()} SCRAPING COMPLETE")
+        print("=" * 70)
+        print(f"Companies attempted:     {len(companies)}")
+        print(f"Companies succeeded:     {successful}")
+        print(f"Total jobs found:        {found}")
+        print("=" * 70)
+
+        return all_jobs
+
+
+class SingleGetBoardScraper(AsyncJSONBoardScraper):
+    """Base class for ATS APIs that serve a company's whole board from one GET."""
+
+    conditional_get = True  # Send If-None-Match and reuse parsed jobs on 304
+
+    def __init__(self, *, pool: Optional[ProcessPoolExecutor] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.pool = pool  # Owned by the run owner; None decodes on the loop's default executor
+        self.etag_cache = ETagCache(self.portal) if self.conditional_get else None
+
+    # ----- Subclass hooks -----
+
+    @abstractmethod
+    def board_url(self, company_slug: str) -> str:
+        """URL of a company's job board."""
+
+    @staticmethod
+    @abstractmethod
+    def iter_jobs(data) -> List[Dict]:
+        """Raw postings from a decoded board response."""
+
+    # ----- Fetching -----
+
+    async def get_company_jobs(self, session: aiohttp.ClientSession, company_slug: str, company_name: str) -> List[Dict]:
+        """
+        Fetch one company's board and return its US software/data jobs.
+
+        Args:
+            session: Shared aiohttp session
+            company_slug: Board ID (e.g., 'anthropic')
+            company_name: Display name (e.g., 'Anthropic')
+
+        Returns:
+            List of job dictionaries
+        """
+        log.debug("🔍 Scraping %s (%s)...", company_name, self.label)
+
+        try:
+            headers = dict(self.headers)
+            if self.etag_cache:
+                headers.update(self.etag_cache.request_headers(company_slug))
+            status, body, response_headers = await self.fetcher.fetch(
+                session, "GET", self.board_url(company_slug), headers=headers
+            )
+
+            # Board unchanged since last run: reuse the jobs parsed then
+            if status == 304 and self.etag_cache:
+                cached = self.etag_cache.cached_jobs(company_slug) or []
+                log.info("   ✅ %s: not modified, %d cached software/data jobs in US", company_name, len(cached))
+                return cached
+
+            if status != 200:
+                log.warning("   ⚠️  %s: HTTP %s", company_name, status)
+                return []
+
+            # Decode and filter off the event loop, in a worker process
+            loop = asyncio.get_running_loop()
+            total, parsed_jobs = await loop.run_in_executor(
+                self.pool, _parse_and_filter, type(self), body, company_name
+            )
+
+            if self.etag_cache:
+                self.etag_cache.store(company_slug, response_headers, parsed_jobs)
+
+            log.info("   ✅ %s: %d software/data jobs in US (of %d)", company_name, len(parsed_jobs), total)
+            return parsed_jobs
+
+        except Exception as e:
+            log.warning("   ❌ %s: %.80s", company_name, e)
+            return []
+
+    async def scrape_company(self, session: aiohttp.ClientSession, company) -> List[Dict]:
+        """Scrape one entry of get_companies(), a (slug, name) pair."""
+        company_slug, company_name = company
+        return await self.get_company_jobs(session, company_slug, company_name)
+
+    # ----- Orchestration -----
+
+    def scrape_all_companies(self) -> List[Dict]:
+        """Scrape all companies (blocking wrapper around scrape_all, with its own worker pool)."""
+        with make_process_pool() as self.pool:
+            jobs = super().scrape_all_companies()
+        self.pool = None
+        return jobs
+
+    async def scrape_all(self) -> List[Dict]:
+        """Scrape all companies concurrently, then save the ETag cache."""
+        jobs = await super().scrape_all()
+        if self.etag_cache:
+            self.etag_cache.save()
+        return jobs
+
+
+def _parse_and_filter(scraper_cls, body: bytes, company_name: str) -> Tuple[int, List[Dict]]:
+    """Decode a board response and keep US software/data jobs (runs in a worker process)."""
+    jobs = scraper_cls.iter_jobs(orjson.loads(body))
+    return len(jobs), scraper_cls.filter_jobs(jobs, company_name)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+SHARED PLAYWRIGHT BROWSER
+=========================
+One headless Chromium per process, shared by every scraper that renders
+pages. Callers open their own contexts/pages on it and never close the
+browser itself; whoever owns the run calls close_browser() at the end.
+"""
+
+import asyncio
+
+from playwright.async_api import async_playwright
+
+_playwright = None
+_browser = None
+_lock = asyncio.Lock()
+
+
+async def get_browser():
+    """Return the shared Chromium, launching it on first use."""
+    global _playwright, _browser
+
+    async with _lock:
+        if _browser is None:
+            _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+        return _browser
+
+
+async def close_browser():
+    """Close the shared Chromium and stop the Playwright driver."""
+    global _playwright, _browser
+
+    async with _lock:
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+SHARED JOB FILTER KEYWORDS
+==========================
+Keyword sets used by the API scrapers' is_tech_role / is_us_location
+checks. Keywords match as substrings of lowercased text ("engineering"
+matches "engineer"), so each set is compiled into one regex alternation.
+"""
+
+import re
+from typing import Iterable
+
+TECH_KEYWORDS = frozenset({
+    "software", "engineer", "developer", "backend", "frontend",
+    "full stack", "fullstack", "data", "scientist", "analyst",
+    "machine learning", "ml", "ai", "artificial intelligence",
+    "devops", "sre", "site reliability", "platform", "infrastructure",
+    "cloud", "systems",
+})
+
+US_KEYWORDS = frozenset({
+    "united states", "usa", "us", "remote", "anywhere",
+    # States
+    "california", "texas", "new york", "florida", "washington",
+    "massachusetts", "illinois", "georgia", "virginia", "pennsylvania",
+    "colorado", "oregon", "north carolina", "arizona",
+    # Cities
+    "san francisco", "seattle", "austin", "boston", "nyc",
+    "los angeles", "chicago", "atlanta", "denver", "portland",
+    "san jose", "palo alto", "mountain view", "sunnyvale", "redmond",
+})
+
+INTL_KEYWORDS = frozenset({
+    "india", "china", "singapore", "london", "uk", "canada",
+    "germany", "france", "japan", "australia", "israel",
+})
+
+
+def keyword_regex(keywords: Iterable[str]) -> re.Pattern:
+    """Compile keywords into a single substring alternation (longest first)."""
+    return re.compile("|".join(map(re.escape, sorted(keywords, key=lambda kw: (-len(kw), kw)))))
+
+
+TECH_RE = keyword_regex(TECH_KEYWORDS)
+US_RE = keyword_regex(US_KEYWORDS)
+INTL_RE = keyword_regex(INTL_KEYWORDS)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+RATE-LIMITED JSON FETCHER
+=========================
+Shared request path for the API scrapers. A global semaphore caps the
+number of requests in flight, a per-host semaphore keeps any single ATS
+from being hammered, and transient failures (429, 5xx, connection errors,
+timeouts) are retried with jittered exponential backoff - honouring
+Retry-After when the server sends one - instead of a fixed sleep.
+
+ETagCache remembers each board's validators and the jobs parsed from it,
+so an unchanged board costs a 304 and no parsing on the next run.
+"""
+
+import asyncio
+import random
+import ssl
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlparse
+
+import aiohttp
+import orjson
+
+# Kept outside jobs/ so it is never committed; restored by actions/cache in CI
+HTTP_CACHE_DIR = Path(".cache") / "http"
+
+# Responses worth another try; anything else is returned to the caller as-is
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF = 10  # Seconds, before jitter
+MAX_RETRY_AFTER = 60  # Seconds; a longer Retry-After would stall the whole run, so it is cut short
+
+# One TLS context per process, so every connection shares its CA store and session cache
+_SSL_CONTEXT = ssl.create_default_context()
+
+
+def make_session() -> aiohttp.ClientSession:
+    """ClientSession for the API scrapers: pooled keep-alive connections and cached DNS."""
+    connector = aiohttp.TCPConnector(
+        ssl=_SSL_CONTEXT,
+        limit=100,
+        limit_per_host=8,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        keepalive_timeout=60
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+class RateLimitedFetcher:
+    """Fetches JSON under global and per-host concurrency limits."""
+
+    def __init__(self, global_limit: int = 16, per_host_limit: int = 4, max_retries: int = 3, timeout: int = 15):
+        self._global_sem = asyncio.Semaphore(global_limit)
+        self._host_sems = defaultdict(lambda: asyncio.Semaphore(per_host_limit))
+        self.max_retries = max_retries
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+
+    @staticmethod
+    def _retry_delay(retry_after, attempt: int) -> float:
+        """Seconds to wait before a retry: Retry-After if longer (capped), else 0.5 * 2^attempt plus jitter."""
+        backoff = min(0.5 * 2 ** attempt, MAX_BACKOFF) + random.random()
+        try:
+            return min(max(float(retry_after), backoff), MAX_RETRY_AFTER)
+        except (TypeError, ValueError):
+            return backoff  # Missing or an HTTP-date
+
+    async def fetch(self, session: aiohttp.ClientSession, method: str, url: str, **kwargs):
+        """
+        Request url and read the raw body.
+
+        Returns:
+            (status, body, headers) - body is None unless status is 200
+        """
+        host = urlparse(url).netloc
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                async with self._global_sem, self._host_sems[host]:
+                    async with session.request(method, url, timeout=self.timeout, **kwargs) as response:
+                        if response.status == 200:
+                            return response.status, await response.read(), response.headers
+                        if response.status not in RETRY_STATUSES or attempt == self.max_retries:
+                            return response.status, None, response.headers
+                        retry_after = response.headers.get('Retry-After')
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self.max_retries:
+                    raise
+
+            # Back off outside the semaphores so other hosts keep their slots
+            await asyncio.sleep(self._retry_delay(retry_after, attempt))
+
+    async def fetch_json(self, session: aiohttp.ClientSession, method: str, url: str, **kwargs):
+        """
+        Request url and decode the JSON body with orjson (straight from bytes).
+
+        Returns:
+            (status, data, headers) - data is None unless status is 200
+        """
+        status, body, headers = await self.fetch(session, method, url, **kwargs)
+        return status, (orjson.loads(body) if body is not None else None), headers
+
+
+class ETagCache:
+    """Per-board ETag/Last-Modified validators plus the jobs parsed from that response."""
+
+    def __init__(self, portal: str):
+        self.path = HTTP_CACHE_DIR / f"{portal}.json"
+        try:
+            self._entries = orjson.loads(self.path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            self._entries = {}
+
+    def request_headers(self, key: str) -> dict:
+        """Conditional request headers for a board seen on an earlier run."""
+        entry = self._entries.get(key)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def cached_jobs(self, key: str):
+        """Jobs stored with the validators, or None if the board was never cached."""
+        entry = self._entries.get(key)
+        return entry["jobs"] if entry else None
+
+    def store(self, key: str, response_headers, jobs: list):
+        """Remember a 200 response's validators and parsed jobs (no-op without validators)."""
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag or last_modified:
+            self._entries[key] = {"etag": etag, "last_modified": last_modified, "jobs": jobs}
+        else:
+            self._entries.pop(key, None)
+
+    def save(self):
+        """Write the cache back to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(orjson.dumps(self._entries))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+JOB RECORD
+==========
+Slotted, immutable record built by the API scrapers' parse_job. Jobs stay
+in this compact form through filtering; only the ones that pass are turned
+into the plain dicts the rest of the pipeline writes out.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Job:
+    """One job posting in the common scraper format."""
+
+    company: str
+    title: str
+    location: str
+    url: str
+    job_id: str
+    # Greenhouse
+    departments: Optional[List[str]] = None
+    # Lever
+    team: Optional[str] = None
+    commitment: Optional[str] = None
+    description: str = ""
+    portal: str = ""
+    # Greenhouse
+    company_slug: Optional[str] = None
+    posted_at: str = ""
+    scraped_at: str = ""
+    # Workday
+    time_type: Optional[str] = None
+    tenant: Optional[str] = None
+    site: Optional[str] = None
+
+    # Lowercased once at construction so the filters don't re-lower per check
+    _tech_text_lc: str = field(init=False, repr=False, compare=False)
+    _location_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Text the tech filter scans: title plus departments (Greenhouse) or team (Lever)
+        extra = " ".join(self.departments) if self.departments is not None else self.team
+        tech_text = self.title if extra is None else f"{self.title} {extra}"
+        object.__setattr__(self, "_tech_text_lc", tech_text.lower())
+        object.__setattr__(self, "_location_lc", self.location.lower())
+
+    def to_dict(self) -> Dict:
+        """Plain dict for JSON output, without the fields this portal doesn't have."""
+        return {
+            name: value
+            for name in _FIELD_NAMES
+            if (value := getattr(self, name)) is not None
+        }
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(Job) if f.init)